@@ -9,6 +9,7 @@ from climate_finance.core.data import ClimateData
 def set_climate_finance_data_path(path):
     from pathlib import Path
     from climate_finance.config import ClimateDataPath
+    from climate_finance.core.loaders import _load_source
     from oda_data import set_data_path
     from pydeflate import set_pydeflate_path
 
@@ -19,6 +20,9 @@ def set_climate_finance_data_path(path):
     set_data_path(Path(path).resolve())
     set_pydeflate_path(Path(path).resolve())
 
+    # Data cached from the previous folder is no longer valid
+    _load_source.cache_clear()
+
 
 __all__ = [
     "set_climate_finance_data_path",
@@ -2,7 +2,10 @@ import pandas as pd
 
 from climate_finance.common.schema import ClimateSchema
 from climate_finance.config import logger
-from climate_finance.oecd.cleaning_tools.tools import keep_only_allocable_aid
+from climate_finance.oecd.cleaning_tools.tools import (
+    ALLOCABLE_AID_TYPES,
+    keep_only_allocable_aid,
+)
 
 
 def to_list_of_ints(value):
@@ -64,6 +67,10 @@ def get_recipients_filter(
     return recipient_column, "in", recipient_code
 
 
+def get_allocable_filter(modality_column: str = "modality") -> tuple:
+    return modality_column, "in", sorted(ALLOCABLE_AID_TYPES)
+
+
 def check_missing(data: pd.DataFrame, column: str, codes: list) -> None:
     if codes is None:
         return
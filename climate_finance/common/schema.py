@@ -194,20 +194,20 @@ VALUE_COLUMNS: list[str] = [
 ]
 
 CRS_TYPES = {
-    ClimateSchema.YEAR: "Int32",
-    ClimateSchema.PROVIDER_CODE: "Int32",
-    ClimateSchema.PROVIDER_NAME: "category",
-    ClimateSchema.RECIPIENT_NAME: "category",
-    ClimateSchema.RECIPIENT_CODE: "Int32",
-    ClimateSchema.AGENCY_NAME: "str",
-    ClimateSchema.AGENCY_CODE: "Int32",
-    ClimateSchema.FLOW_NAME: "str",
-    ClimateSchema.FLOW_CODE: "Int32",
-    ClimateSchema.MITIGATION: "str",
-    ClimateSchema.ADAPTATION: "str",
-    ClimateSchema.PURPOSE_CODE: "Int32",
-    ClimateSchema.SECTOR_CODE: "Int32",
-    ClimateSchema.FINANCE_TYPE: "Int32",
+    ClimateSchema.YEAR: "int16[pyarrow]",
+    ClimateSchema.PROVIDER_CODE: "int16[pyarrow]",
+    ClimateSchema.PROVIDER_NAME: "string[pyarrow]",
+    ClimateSchema.RECIPIENT_NAME: "string[pyarrow]",
+    ClimateSchema.RECIPIENT_CODE: "int16[pyarrow]",
+    ClimateSchema.AGENCY_NAME: "string[pyarrow]",
+    ClimateSchema.AGENCY_CODE: "int16[pyarrow]",
+    ClimateSchema.FLOW_NAME: "string[pyarrow]",
+    ClimateSchema.FLOW_CODE: "int32[pyarrow]",
+    ClimateSchema.MITIGATION: "string[pyarrow]",
+    ClimateSchema.ADAPTATION: "string[pyarrow]",
+    ClimateSchema.PURPOSE_CODE: "int32[pyarrow]",
+    ClimateSchema.SECTOR_CODE: "int32[pyarrow]",
+    ClimateSchema.FINANCE_TYPE: "int32[pyarrow]",
 }
 
 CLIMATE_VALUES = [
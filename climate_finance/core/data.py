@@ -328,24 +328,23 @@ class ClimateData:
             # Return to end this step
             return
 
-        # Otherwise convert all the loaded sources to climate
-        for loaded_source in self._data:
-            logger.info(f"Processing {loaded_source} data...")
-
-            # Apply guard conditions to validate the transformation
-            self._validate_transformation_conditions(source=source)
-
-            # Get the transformation function
-            transform_function = self._get_transform_function(source=source)
-
-            # Transform the data, if a transformation function is available
-            if transform_function:
-                self.data[source] = transform_function(
-                    df=self._data[source],
-                    percentage_significant=self.spending_args["coefficients"][0],
-                    percentage_principal=self.spending_args["coefficients"][1],
-                    highest_marker=self.spending_args["highest_marker"],
-                ).pipe(filter_flows, flows=self.spending_args["flows"])
+        # Otherwise convert the requested source to climate
+        logger.info(f"Processing {source} data...")
+
+        # Apply guard conditions to validate the transformation
+        self._validate_transformation_conditions(source=source)
+
+        # Get the transformation function
+        transform_function = self._get_transform_function(source=source)
+
+        # Transform the data, if a transformation function is available
+        if transform_function:
+            self.data[source] = transform_function(
+                df=self._data[source],
+                percentage_significant=self.spending_args["coefficients"][0],
+                percentage_principal=self.spending_args["coefficients"][1],
+                highest_marker=self.spending_args["highest_marker"],
+            ).pipe(filter_flows, flows=self.spending_args["flows"])
 
     def set_only_oda(self) -> "ClimateData":
         """
@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import Any
 
 import pandas as pd
@@ -101,6 +103,53 @@ AVAILABLE_LOADERS = {
 }
 
 
+def _to_tuple(values) -> tuple | None:
+    """Convert a setting (None, a single value or an iterable) to a hashable tuple."""
+    if values is None:
+        return None
+    if isinstance(values, (str, int)):
+        return (values,)
+    return tuple(values)
+
+
+# Whether loaded sources are kept in memory. See cache_loaded_sources.
+_CACHE_SOURCES: bool = False
+
+
+@lru_cache(maxsize=2)
+def _load_source(
+    source_name: str,
+    years: tuple[int, ...],
+    providers: tuple | None,
+    recipients: tuple | None,
+) -> pd.DataFrame:
+    """Load the data for a source. Results are cached for the same arguments,
+    so repeated requests for the same data are not read from disk again."""
+    settings = {
+        "years": list(years),
+        "providers": None if providers is None else list(providers),
+        "recipients": None if recipients is None else list(recipients),
+        "update": False,
+    }
+    return AVAILABLE_LOADERS[source_name](settings=settings).get_data()
+
+
+@contextmanager
+def cache_loaded_sources():
+    """Keep loaded sources in memory while the context is open, so that a source
+    requested more than once with the same settings is only read from disk once.
+    The cached data is released when the context closes."""
+    global _CACHE_SOURCES
+
+    previous, _CACHE_SOURCES = _CACHE_SOURCES, True
+    try:
+        yield
+    finally:
+        _CACHE_SOURCES = previous
+        if not previous:
+            _load_source.cache_clear()
+
+
 def get_data(source_name: str, settings: dict[str, Any]) -> pd.DataFrame:
     loader = AVAILABLE_LOADERS.get(source_name)
 
@@ -108,7 +157,20 @@ def get_data(source_name: str, settings: dict[str, Any]) -> pd.DataFrame:
         raise ValueError(f"Invalid source: {source_name}")
 
     try:
-        data = loader(settings=settings).get_data()
+        # If the data must be updated, cached data is no longer valid
+        if settings.get("update"):
+            _load_source.cache_clear()
+            data = loader(settings=settings).get_data()
+        elif _CACHE_SOURCES:
+            # A copy is returned so that callers cannot modify the cached data
+            data = _load_source(
+                source_name,
+                years=_to_tuple(settings.get("years", [])),
+                providers=_to_tuple(settings.get("providers")),
+                recipients=_to_tuple(settings.get("recipients")),
+            ).copy()
+        else:
+            data = loader(settings=settings).get_data()
         logger.info(f"Loaded raw {source_name} data")
         return data
     except NotImplementedError:
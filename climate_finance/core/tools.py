@@ -1,8 +1,11 @@
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 from bblocks import convert_id
 from oda_data.clean_data.channels import add_multi_channel_codes
 from oda_data.clean_data.schema import OdaSchema
-from thefuzz import process
+from rapidfuzz import fuzz, process, utils
 
 from climate_finance.common.schema import (
     ClimateSchema,
@@ -16,6 +19,12 @@ from climate_finance.oecd.cleaning_tools.tools import (
     channel_codes_to_names,
 )
 
+# Minimum (rounded) similarity score for a provider name to be fuzzy matched
+PROVIDER_MATCH_THRESHOLD: int = 89
+
+# Latin-1 characters which are dropped from names before fuzzy matching
+_NON_ASCII_CHARACTERS: dict = {i: None for i in range(128, 256)}
+
 
 def oecd_flow_mapping(flow: str) -> str:
     """Map the flow type to the OECD CRS flow type.
@@ -332,19 +341,38 @@ def merge_spending_and_contributions(
         c for c in spending_data if c in contributions_data and c != ClimateSchema.VALUE
     ]
 
-    # Create a list to store the individual data for providers
-    combined = []
+    # Contributions without a provider code are not matched to any spending
+    contributions_data = contributions_data.loc[
+        lambda d: d[ClimateSchema.PROVIDER_CODE].notna()
+    ]
 
-    for provider in contributions_data[ClimateSchema.PROVIDER_CODE].unique():
-        contrib_ = contributions_data.loc[
-            lambda d: d[ClimateSchema.PROVIDER_CODE] == provider
-        ]
-        merged_ = contrib_.merge(
-            spending_data, on=idx, how="inner", suffixes=("_inflow", "_spending_share")
+    # Merge all providers at once. Each contribution row can only match spending rows
+    # on the shared index, so this is the same as merging provider by provider.
+    merged = contributions_data.assign(
+        _contribution=range(len(contributions_data))
+    ).merge(
+        spending_data.assign(_spending=range(len(spending_data))),
+        on=idx,
+        how="inner",
+        suffixes=("_inflow", "_spending_share"),
+    )
+
+    # Keep the rows of each provider together, in the order providers first appear.
+    # Within a provider, rows follow the contributions and then the spending data.
+    providers = pd.Index(contributions_data[ClimateSchema.PROVIDER_CODE].unique())
+    order = np.lexsort(
+        (
+            merged["_spending"],
+            merged["_contribution"],
+            providers.get_indexer(merged[ClimateSchema.PROVIDER_CODE]),
         )
-        combined.append(merged_)
+    )
 
-    return pd.concat(combined, ignore_index=True)
+    return (
+        merged.iloc[order]
+        .drop(columns=["_contribution", "_spending"])
+        .reset_index(drop=True)
+    )
 
 
 def calculate_imputations(data: pd.DataFrame) -> pd.DataFrame:
@@ -373,19 +401,28 @@ def calculate_imputations(data: pd.DataFrame) -> pd.DataFrame:
     return data
 
 
-def get_oecd_classification() -> dict:
-    """Read the OECD CRS classification and return it as a dictionary."""
+@lru_cache(maxsize=1)
+def _read_oecd_classification() -> dict:
+    """Read the OECD CRS classification once and build the mapping by type."""
 
     df = pd.read_csv(ClimateDataPath.scripts / "core" / "oecd_classification.csv")
 
     types = {}
 
-    for dt in df["type"].unique():
-        types[dt] = df.loc[df["type"] == dt].set_index("code")["name"].to_dict()
+    # A single pass over the groups, keeping the order in which types appear
+    for dt, group in df.groupby("type", sort=False):
+        types[dt] = group.set_index("code")["name"].to_dict()
 
     return types
 
 
+def get_oecd_classification() -> dict:
+    """Read the OECD CRS classification and return it as a dictionary."""
+
+    # Return copies so that callers can't modify the cached mapping
+    return {dt: names.copy() for dt, names in _read_oecd_classification().items()}
+
+
 def get_available_providers(include_private: bool = False) -> dict:
     """return a list of available providers"""
 
@@ -403,21 +440,42 @@ def get_available_providers(include_private: bool = False) -> dict:
     return available
 
 
+def _fuzzy_process(name: str) -> str:
+    """Prepare a name for fuzzy matching. Latin-1 characters are dropped, and the
+    name is lowercased, trimmed and stripped of non-alphanumeric characters."""
+    return utils.default_process(str(name).translate(_NON_ASCII_CHARACTERS))
+
+
 def fuzzy_match_provider(providers: list[str], options: dict) -> list:
     results = []
     providers_list = list(options)
 
-    for user_input in providers:
+    if not providers or not providers_list:
+        return results
+
+    # Score all the user inputs against all the available providers in a single
+    # batched call, spread across all available cores. Scores below the cutoff
+    # are returned as 0.
+    scores = process.cdist(
+        [utils.default_process(provider) for provider in providers],
+        providers_list,
+        scorer=fuzz.WRatio,
+        processor=_fuzzy_process,
+        score_cutoff=PROVIDER_MATCH_THRESHOLD - 0.5,
+        dtype=np.float64,
+        workers=-1,
+    )
+
+    for user_input, provider_scores in zip(providers, scores):
         # Finding the best match for the user_input in the list of countries
-        best_match = process.extractOne(user_input, providers_list)
-        # best_match is a tuple like ('Country Name', score)
-        if best_match:
-            if best_match[1] < 89:
-                logger.info(f"No match found for {user_input}")
-                continue
-            # Find the key in the dictionary corresponding to the matched country
-            match_key = options[best_match[0]]
-            results.append(match_key)
+        best_match = provider_scores.argmax()
+        # The threshold applies to the score rounded to an integer
+        if np.rint(provider_scores[best_match]) < PROVIDER_MATCH_THRESHOLD:
+            logger.info(f"No match found for {user_input}")
+            continue
+        # Find the key in the dictionary corresponding to the matched country
+        match_key = options[providers_list[best_match]]
+        results.append(match_key)
 
     return results
 
@@ -106,15 +106,17 @@ def check_and_filter_parties(
         party = [party]
 
     if party is not None:
+        # Find the rows for the requested parties
+        mask = df[party_col].isin(party)
         # Check that the requested parties are in the CRS data
-        missing_party = set(party) - set(df[party_col].unique())
+        missing_party = set(party) - set(df.loc[mask, party_col].unique())
         # Log a warning if any of the requested parties are not in the CRS data
         if len(missing_party) > 0:
             logger.warning(
                 f"The following parties are not found in CRS data:\n{missing_party}"
             )
         # Filter the data to only include the requested parties
-        return df.loc[lambda d: d[party_col].isin(party)]
+        return df.loc[mask]
 
     # if Party is None, return the original dataframe
     return df
@@ -92,7 +92,7 @@ def process_not_climate_relevant(df) -> pd.DataFrame:
     """
 
     return (
-        df.copy(deep=True)[
+        df.loc[
             (df[ClimateSchema.MITIGATION] == 0) & (df[ClimateSchema.ADAPTATION] == 0)
         ]
         .assign(
@@ -15,18 +15,18 @@ def filter_climate_data(df, highest_marker: bool = True):
         the 'MITIGATION' or 'ADAPTATION' column has a value greater than 0, and where
         the 'MITIGATION' and 'ADAPTATION' values are not equal.
     """
+    mitigation = df[ClimateSchema.MITIGATION]
+    adaptation = df[ClimateSchema.ADAPTATION]
+
     # Climate is where adaptation OR mitigation is larger than 0
-    # and where adaptation and mitigation are not equal
-    data = df.copy(deep=True).loc[
-        lambda d: (d[ClimateSchema.MITIGATION] > 0) | (d[ClimateSchema.ADAPTATION] > 0)
-    ]
+    mask = (mitigation > 0) | (adaptation > 0)
 
+    # and where adaptation and mitigation are not equal
     if highest_marker:
-        data = data.loc[
-            lambda d: d[ClimateSchema.MITIGATION] != d[ClimateSchema.ADAPTATION]
-        ]
+        mask &= mitigation != adaptation
 
-    return data
+    # Only the filtered rows are copied
+    return df.loc[mask].copy()
 
 
 def apply_highest_marker(df):
@@ -40,16 +40,21 @@ def apply_highest_marker(df):
         The modified dataframe with the highest marker value applied.
     """
 
+    # Find where mitigation is the highest marker
+    mitigation_highest = (
+        df[ClimateSchema.MITIGATION] > df[ClimateSchema.ADAPTATION]
+    ).to_numpy(dtype=bool)
+
     # Select the highest marker and assign it to the indicator column
     df[ClimateSchema.INDICATOR] = np.where(
-        df[ClimateSchema.MITIGATION] > df[ClimateSchema.ADAPTATION],
+        mitigation_highest,
         ClimateSchema.MITIGATION,
         ClimateSchema.ADAPTATION,
     )
 
     # Select the highest marker value and assign it to the level column
     df[ClimateSchema.LEVEL] = np.where(
-        df[ClimateSchema.MITIGATION] > df[ClimateSchema.ADAPTATION],
+        mitigation_highest,
         df[ClimateSchema.MITIGATION],
         df[ClimateSchema.ADAPTATION],
     )
@@ -102,35 +107,37 @@ def apply_coefficients(df, percentage_significant, percentage_principal):
         The modified dataframe with the updated climate values.
     """
 
-    # Apply coefficients to 'significant' data
-    df.loc[
-        lambda d: (d[ClimateSchema.LEVEL] < 2),
-        ClimateSchema.VALUE,
-    ] *= percentage_significant
+    level = df[ClimateSchema.LEVEL]
 
-    # Apply coefficients to 'principal' data
-    df.loc[
-        lambda d: (d[ClimateSchema.LEVEL] == 2),
-        ClimateSchema.VALUE,
-    ] *= percentage_principal
+    # Pick the coefficient for each row: 'significant' below 2, 'principal' at 2.
+    # Other levels are left unchanged.
+    coefficients = np.select(
+        [(level < 2).to_numpy(dtype=bool), (level == 2).to_numpy(dtype=bool)],
+        [percentage_significant, percentage_principal],
+        default=1,
+    )
+
+    # Apply the coefficients in a single pass
+    df[ClimateSchema.VALUE] = df[ClimateSchema.VALUE] * coefficients
 
     return df
 
 
 def filter_cross_cutting_data(df, cross_cutting_threshold, highest_marker):
+    mitigation = df[ClimateSchema.MITIGATION]
+    adaptation = df[ClimateSchema.ADAPTATION]
+
     # Filter for data where both mitigation and adaptation are larger than the threshold
-    data = df.copy(deep=True)[
-        (df[ClimateSchema.MITIGATION] > cross_cutting_threshold)
-        & (df[ClimateSchema.ADAPTATION] > cross_cutting_threshold)
-    ]
+    mask = (mitigation > cross_cutting_threshold) & (
+        adaptation > cross_cutting_threshold
+    )
 
     # If highest_marker is True, filter for data where mitigation and adaptation are equal
     if highest_marker:
-        data = data.loc[
-            lambda d: d[ClimateSchema.MITIGATION] == d[ClimateSchema.ADAPTATION]
-        ]
+        mask &= mitigation == adaptation
 
-    return data
+    # Only the filtered rows are copied
+    return df.loc[mask].copy()
 
 
 def process_cross_cutting_data(
@@ -170,24 +170,20 @@ def add_provider_agency_names(data: pd.DataFrame) -> pd.DataFrame:
     idx = [ClimateSchema.PROVIDER_CODE, ClimateSchema.AGENCY_CODE]
     data = data.pipe(_add_names, names=names, idx=idx)
 
-    provider_names = read_provider_names().pipe(
-        idx_to_str, idx=[ClimateSchema.PROVIDER_CODE]
+    # Map provider codes to provider names. The codes are unique, so a lookup is
+    # enough to fill any names which were not matched by provider and agency.
+    provider_names = (
+        read_provider_names()
+        .pipe(idx_to_str, idx=[ClimateSchema.PROVIDER_CODE])
+        .set_index(ClimateSchema.PROVIDER_CODE)[ClimateSchema.PROVIDER_NAME]
     )
     data = data.pipe(idx_to_str, idx=[ClimateSchema.PROVIDER_CODE])
 
-    # Add the names to the data
-    data = data.merge(
-        provider_names,
-        on=[ClimateSchema.PROVIDER_CODE],
-        how="left",
-        suffixes=("", "_names"),
-    )
-
     data[ClimateSchema.PROVIDER_NAME] = data[ClimateSchema.PROVIDER_NAME].fillna(
-        data[f"{ClimateSchema.PROVIDER_NAME}_names"]
+        data[ClimateSchema.PROVIDER_CODE].map(provider_names)
     )
 
-    return data.drop(columns=[f"{ClimateSchema.PROVIDER_NAME}_names"])
+    return data
 
 
 def add_provider_names(data: pd.DataFrame) -> pd.DataFrame:
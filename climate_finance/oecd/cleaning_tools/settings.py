@@ -1,5 +1,45 @@
 from climate_finance.common.schema import ClimateSchema
 
+# Relevant CRS columns for data extraction. Stored as a tuple so that it is only
+# built once and cannot be modified by callers.
+RELEVANT_CRS_COLUMNS: tuple[str, ...] = (
+    ClimateSchema.YEAR,
+    ClimateSchema.PROVIDER_CODE,
+    ClimateSchema.PROVIDER_NAME,
+    ClimateSchema.AGENCY_NAME,
+    ClimateSchema.AGENCY_CODE,
+    ClimateSchema.RECIPIENT_CODE,
+    ClimateSchema.RECIPIENT_NAME,
+    ClimateSchema.FLOW_CODE,
+    ClimateSchema.FLOW_NAME,
+    ClimateSchema.SECTOR_CODE,
+    ClimateSchema.SECTOR_NAME,
+    ClimateSchema.PURPOSE_CODE,
+    ClimateSchema.PURPOSE_NAME,
+    ClimateSchema.PROJECT_TITLE,
+    ClimateSchema.CRS_ID,
+    ClimateSchema.PROJECT_ID,
+    ClimateSchema.PROJECT_DESCRIPTION,
+    ClimateSchema.CHANNEL_CODE,
+    ClimateSchema.CHANNEL_NAME,
+    ClimateSchema.COMMITMENT_DATE,
+    ClimateSchema.EXPECTED_START,
+    ClimateSchema.EXPECTED_END,
+    ClimateSchema.SDG_FOCUS,
+    ClimateSchema.FINANCE_TYPE,
+    ClimateSchema.MITIGATION,
+    ClimateSchema.ADAPTATION,
+)
+
+# Flow columns in the CRS data
+FLOW_COLUMNS: tuple[str, ...] = (
+    ClimateSchema.USD_COMMITMENT,
+    ClimateSchema.USD_DISBURSEMENT,
+    ClimateSchema.USD_RECEIVED,
+    ClimateSchema.USD_GRANT_EQUIV,
+    ClimateSchema.USD_NET_DISBURSEMENT,
+)
+
 
 def relevant_crs_columns() -> list:
     """
@@ -8,34 +48,7 @@ def relevant_crs_columns() -> list:
     Returns:
         list: A list of column names considered relevant for data extraction."""
 
-    return [
-        ClimateSchema.YEAR,
-        ClimateSchema.PROVIDER_CODE,
-        ClimateSchema.PROVIDER_NAME,
-        ClimateSchema.AGENCY_NAME,
-        ClimateSchema.AGENCY_CODE,
-        ClimateSchema.RECIPIENT_CODE,
-        ClimateSchema.RECIPIENT_NAME,
-        ClimateSchema.FLOW_CODE,
-        ClimateSchema.FLOW_NAME,
-        ClimateSchema.SECTOR_CODE,
-        ClimateSchema.SECTOR_NAME,
-        ClimateSchema.PURPOSE_CODE,
-        ClimateSchema.PURPOSE_NAME,
-        ClimateSchema.PROJECT_TITLE,
-        ClimateSchema.CRS_ID,
-        ClimateSchema.PROJECT_ID,
-        ClimateSchema.PROJECT_DESCRIPTION,
-        ClimateSchema.CHANNEL_CODE,
-        ClimateSchema.CHANNEL_NAME,
-        ClimateSchema.COMMITMENT_DATE,
-        ClimateSchema.EXPECTED_START,
-        ClimateSchema.EXPECTED_END,
-        ClimateSchema.SDG_FOCUS,
-        ClimateSchema.FINANCE_TYPE,
-        ClimateSchema.MITIGATION,
-        ClimateSchema.ADAPTATION,
-    ]
+    return list(RELEVANT_CRS_COLUMNS)
 
 
 def all_flow_columns() -> list:
@@ -46,10 +59,4 @@ def all_flow_columns() -> list:
         list: A list of column names considered relevant for data extraction.
 
     """
-    return [
-        ClimateSchema.USD_COMMITMENT,
-        ClimateSchema.USD_DISBURSEMENT,
-        ClimateSchema.USD_RECEIVED,
-        ClimateSchema.USD_GRANT_EQUIV,
-        ClimateSchema.USD_NET_DISBURSEMENT,
-    ]
+    return list(FLOW_COLUMNS)
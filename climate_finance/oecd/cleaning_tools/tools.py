@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import numpy as np
 import pandas as pd
 from oda_data import set_data_path, ODAData
@@ -16,10 +18,34 @@ from climate_finance.oecd.cleaning_tools.settings import relevant_crs_columns
 
 set_data_path(ClimateDataPath.raw_data)
 
+# Aid types (modalities) considered allocable
+ALLOCABLE_AID_TYPES: frozenset[str] = frozenset(
+    {
+        "A02",
+        "B01",
+        "B03",
+        "B031",
+        "B032",
+        "B033",
+        "B04",
+        "C01",
+        "D01",
+        "D02",
+        "E01",
+    }
+)
+
+
+@lru_cache(maxsize=1)
+def _read_crs_official_mapping() -> pd.DataFrame:
+    """Read the CRS official mapping file. The file is only parsed once per session."""
+    return pd.read_csv(ClimateDataPath.oecd_cleaning_tools / "crs_channel_mapping.csv")
+
 
 def get_crs_official_mapping() -> pd.DataFrame:
     """Get the CRS official mapping file."""
-    return pd.read_csv(ClimateDataPath.oecd_cleaning_tools / "crs_channel_mapping.csv")
+    # Return a copy so that callers can't modify the cached data
+    return _read_crs_official_mapping().copy()
 
 
 def convert_flows_millions_to_units(df: pd.DataFrame, flow_columns) -> pd.DataFrame:
@@ -103,27 +129,14 @@ def keep_only_allocable_aid(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: A dataframe containing only the rows with allocable aid types."""
 
-    aid_types = [
-        "A02",
-        "B01",
-        "B03",
-        "B031",
-        "B032",
-        "B033",
-        "B04",
-        "C01",
-        "D01",
-        "D02",
-        "E01",
-    ]
-    return df.loc[lambda d: d[ClimateSchema.FLOW_MODALITY].isin(aid_types)].reset_index(
-        drop=True
-    )
+    mask = df[ClimateSchema.FLOW_MODALITY].isin(ALLOCABLE_AID_TYPES)
+
+    return df.loc[mask].reset_index(drop=True)
 
 
 def replace_missing_climate_with_zero(df: pd.DataFrame, column: str) -> pd.DataFrame:
     """
-    Replaces missing values in a specified column with an empty string.
+    Replaces missing values (nulls or "nan" strings) in a specified column with "0".
 
     Args:
         df (pd.DataFrame): The input dataframe with CRS data.
@@ -131,10 +144,16 @@ def replace_missing_climate_with_zero(df: pd.DataFrame, column: str) -> pd.DataF
 
     Returns:
         pd.DataFrame: The dataframe with missing values in the specified column
-        replaced by an empty string.
+        replaced by "0".
     """
 
-    return df.assign(**{column: lambda d: d[column].replace("nan", "0")})
+    return df.assign(
+        **{
+            column: lambda d: d[column].mask(
+                d[column].isna() | d[column].eq("nan").fillna(False), "0"
+            )
+        }
+    )
 
 
 def key_crs_columns_to_str(df: pd.DataFrame) -> pd.DataFrame:
@@ -6,9 +6,6 @@ import time
 
 import pandas as pd
 from dateutil.utils import today
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 
 from climate_finance.common.schema import (
     CRS_MAPPING,
@@ -33,6 +30,11 @@ def fetch_file_from_url_selenium(url: str) -> io.BytesIO:
     Returns:
         A bytes object containing the file data.
     """
+    # Selenium is only needed here, so it is imported when a download is made
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from webdriver_manager.chrome import ChromeDriverManager
+
     # Create a temporary directory for downloads
     download_dir = tempfile.mkdtemp()
 
@@ -4,6 +4,7 @@ from oda_data.clean_data.channels import clean_string
 
 from climate_finance.common.analysis_tools import (
     add_net_disbursement,
+    get_allocable_filter,
     get_providers_filter,
     get_recipients_filter,
 )
@@ -58,6 +59,7 @@ def get_crs(
     provider_code: list[str | int] | str | int | None = None,
     recipient_code: list[str | int] | str | int | None = None,
     force_update: bool = False,
+    allocable: bool = False,
 ) -> pd.DataFrame:
     """
     Fetches bilateral spending data for a given flow type and time period.
@@ -71,6 +73,7 @@ def get_crs(
         recipient_code (list[str] | str, optional): The recipient code(s) to filter the data by.
         force_update (bool, optional): If True, the data is updated from the source.
         Defaults to False.
+        allocable (bool, optional): If True, only allocable aid is read. Defaults to False.
 
     Returns:
         pd.DataFrame: A dataframe containing bilateral spending data for
@@ -86,6 +89,9 @@ def get_crs(
         filters.append(get_providers_filter(provider_code))
     if recipient_code is not None:
         filters.append(get_recipients_filter(recipient_code))
+    # Allocable aid filter, applied when reading the parquet file
+    if allocable:
+        filters.append(get_allocable_filter())
 
     # Check if data should be forced to update
     if force_update:
@@ -110,22 +116,28 @@ def get_crs(
     # Add net disbursement
     crs = crs.pipe(add_net_disbursement)
 
+    # Columns which identify each row, other than the flow type
+    id_columns = [
+        c for c in groupby if c in crs.columns and c != ClimateSchema.FLOW_TYPE
+    ]
+
+    # The flows are summed while still in wide format, so that only the
+    # aggregated rows are melted into a flow_type column.
     crs = (
         crs.filter(columns + flow_columns, axis=1)  # Keep only relevant columns
         .pipe(clean_adaptation_and_mitigation_columns)
         .pipe(convert_flows_millions_to_units, flow_columns=flow_columns)
-        .filter(items=groupby + flow_columns)
+        .groupby(by=id_columns, dropna=False, observed=True)[flow_columns]
+        .sum()
+        .reset_index()
         .melt(
-            id_vars=[
-                c for c in groupby if c in crs.columns and c != ClimateSchema.FLOW_TYPE
-            ],
+            id_vars=id_columns,
             value_vars=flow_columns,
             var_name=ClimateSchema.FLOW_TYPE,
             value_name=ClimateSchema.VALUE,
         )
-        .groupby(by=groupby, dropna=False, observed=True)[ClimateSchema.VALUE]
-        .sum()
-        .reset_index()
+        .filter(items=groupby + [ClimateSchema.VALUE])
+        .sort_values(by=groupby)
         .loc[lambda d: d[ClimateSchema.VALUE] != 0]
         .reset_index(drop=True)
     )
@@ -161,10 +173,9 @@ def get_crs_allocable_spending(
         provider_code=provider_code,
         recipient_code=recipient_code,
         force_update=force_update,
+        allocable=True,
     )
 
-    crs = crs.pipe(keep_only_allocable_aid)
-
     return crs.reset_index(drop=True)
 
 
@@ -83,6 +83,9 @@ SUMMARY_COLUMNS: list = [
     "value",
 ]
 
+# Currency codes are reported in brackets, e.g. "Euro (EUR)"
+CURRENCY_PATTERN = re.compile(r"\((.*?)\)")
+
 
 def clean_currency(df: pd.DataFrame, currency_column: str = "currency") -> pd.DataFrame:
     """
@@ -96,14 +99,18 @@ def clean_currency(df: pd.DataFrame, currency_column: str = "currency") -> pd.Da
         df (pd.DataFrame): The dataframe with cleaned currency column.
     """
 
+    # The column holds only a handful of distinct values, so clean those once
+    currencies = pd.Series(df[currency_column].unique())
+
     # Extract currency codes from strings
-    extracted_currency = df[currency_column].str.extract(r"\((.*?)\)")[0]
+    extracted_currency = currencies.str.extract(CURRENCY_PATTERN)[0]
 
     # Create a mask for strings with length 3
-    mask_len3 = df[currency_column].str.len() == 3
+    mask_len3 = currencies.str.len() == 3
 
-    # Use np.where to combine conditions and update the currency column
-    df[currency_column] = np.where(mask_len3, df[currency_column], extracted_currency)
+    # Use np.where to combine conditions and map the result back to every row
+    cleaned = np.where(mask_len3, currencies, extracted_currency)
+    df[currency_column] = df[currency_column].map(dict(zip(currencies, cleaned)))
 
     return df
 
@@ -143,18 +150,23 @@ def harmonise_type_of_support(
     # Handle None values and convert to lowercase
     series = df[type_of_support_column].fillna("unknown").str.lower()
 
+    # The column holds only a handful of distinct values, so classify those once
+    values = pd.Series(series.unique())
+
     # Create masks for each condition
-    mask_cross_cutting = series.str.contains("cross-cutting")
-    mask_adaptation = series.str.contains("adaptation")
-    mask_mitigation = series.str.contains("mitigation")
-    mask_other = series.str.contains("other")
+    mask_cross_cutting = values.str.contains("cross-cutting")
+    mask_adaptation = values.str.contains("adaptation")
+    mask_mitigation = values.str.contains("mitigation")
+    mask_other = values.str.contains("other")
 
     # Use np.select to conditionally assign new values
     conditions = [mask_cross_cutting, mask_adaptation, mask_mitigation, mask_other]
     choices = [CROSS_CUTTING, ADAPTATION, MITIGATION, OTHER]
+    harmonised = dict(zip(values, np.select(conditions, choices, default=values)))
 
+    # Map the harmonised values back to every row
     cleaned_series = (
-        pd.Series(np.select(conditions, choices, default=series))
+        pd.Series(series.map(harmonised).to_numpy(dtype=object))
         .replace("unknown", pd.NA)
         .reset_index(drop=True)
     )
@@ -265,18 +277,18 @@ def clean_funding_source(
         pd.DataFrame: The dataframe with cleaned funding source column
     """
     # Handle missing values and convert to lowercase
-    df[funding_source_column] = df[funding_source_column].fillna("unknown").str.lower()
+    series = df[funding_source_column].fillna("unknown").str.lower()
+
+    # The column holds only a handful of distinct values, so classify those once
+    values = pd.Series(series.unique(), dtype=series.dtype)
 
     # Handle 'other' cases and 'oda/oof'
-    mask_other = df[funding_source_column].str.contains("other")
-    mask_oda = df[funding_source_column].str.contains("oda")
-    mask_oof = df[funding_source_column].str.contains("oof")
-    mask_len3 = df[funding_source_column].str.len() == 3
-
-    df[funding_source_column] = (
-        df[funding_source_column]
-        .mask(mask_len3, df[funding_source_column])
-        .mask(mask_other & mask_oda & mask_oof, "oda/oof")
+    mask_other = values.str.contains("other")
+    mask_oda = values.str.contains("oda")
+    mask_oof = values.str.contains("oof")
+
+    cleaned = (
+        values.mask(mask_other & mask_oda & mask_oof, "oda/oof")
         .mask(mask_other & mask_oda & ~mask_oof, "oda")
         .mask(mask_other & ~mask_oda & mask_oof, "oof")
         .mask(mask_other & ~mask_oda & ~mask_oof, "other")
@@ -285,4 +297,9 @@ def clean_funding_source(
         .mask(~mask_oda & mask_oof, "oof")
     )
 
+    # Map the cleaned values back to every row
+    df[funding_source_column] = series.map(dict(zip(values, cleaned))).astype(
+        series.dtype
+    )
+
     return df
@@ -18,10 +18,10 @@ def _check_brs(data: pd.DataFrame, br: list[int]) -> None:
         br = [str(br)]
 
     try:
-        # Get the list of BRs in the data
-        data_brs = data["Data source"].unique()
+        # Get the set of BRs in the data (for constant-time membership checks)
+        data_brs = set(data["Data source"].unique())
     except KeyError:
-        data_brs = data["Data Source"].unique()
+        data_brs = set(data["Data Source"].unique())
 
     # Check that the right BRs were included
     missing_brs = [b for b in br if f"BR_{b}" not in data_brs]
@@ -47,11 +47,11 @@ def _check_years(data: pd.DataFrame, start_year: int, end_year: int) -> None:
 
     """
 
-    # Get the list of years in the data
+    # Get the set of years in the data
     try:
-        data_years = data["Year"].unique()
+        data_years = set(data["Year"].unique())
     except KeyError:
-        data_years = data["year"].unique()
+        data_years = set(data["year"].unique())
 
     # Check that the right years were included
     missing_years = [y for y in range(start_year, end_year + 1) if y not in data_years]
@@ -76,11 +76,11 @@ def _check_parties(data: pd.DataFrame, party: str | list[str]) -> None:
 
     """
 
-    # Get the list of parties in the data
+    # Get the set of parties in the data
     try:
-        data_parties = data["Party"].unique()
+        data_parties = set(data["Party"].unique())
     except KeyError:
-        data_parties = data["party"].unique()
+        data_parties = set(data["party"].unique())
 
     # Check that the right parties were included
     missing_parties = [p for p in party if p not in data_parties]
@@ -1,20 +1,20 @@
 """This script downloads data from the UNFCCC data interface."""
 
-import fnmatch
 import os
 import pathlib
+from functools import lru_cache
 from time import sleep
+from typing import TYPE_CHECKING
 
 import pandas as pd
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
 
 from climate_finance.config import ClimateDataPath, logger
 
+# Selenium and webdriver_manager are slow to import and only needed when data is
+# downloaded, so they are imported inside the functions that use them.
+if TYPE_CHECKING:
+    from selenium import webdriver
+
 # Set the path where the files will be saved
 SAVE_FILES_TO: str = ClimateDataPath.raw_data / "unfccc_data_interface_files"
 
@@ -172,8 +172,28 @@ PARTY_ID = {
 }
 
 
-def _get_driver(folder: str) -> webdriver.chrome:
+@lru_cache(maxsize=1)
+def _chrome_driver_path() -> str:
+    """Install (or find) the Chrome driver. This involves disk and network checks,
+    so it is only done once per session."""
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    return ChromeDriverManager().install()
+
+
+def _selenium_wait_tools() -> tuple:
+    """Import the selenium tools used to find page elements and wait for them."""
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    return By, EC, WebDriverWait
+
+
+def _get_driver(folder: str) -> "webdriver.chrome":
     """Get driver for Chrome. A folder name must be provided to save the files to."""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
 
     # Create options
     options = webdriver.ChromeOptions()
@@ -200,14 +220,15 @@ def _get_driver(folder: str) -> webdriver.chrome:
     options.add_experimental_option("prefs", prefs)
 
     # Get driver
-    chrome = ChromeDriverManager().install()
+    chrome = _chrome_driver_path()
 
     # Return driver with the options
     return webdriver.Chrome(service=Service(chrome), options=options)
 
 
-def _select_party(driver: webdriver.chrome, settings: dict, donor: str) -> None:
+def _select_party(driver: "webdriver.chrome", settings: dict, donor: str) -> None:
     """Select the party from the dropdown menu."""
+    By, EC, WebDriverWait = _selenium_wait_tools()
 
     # Get the party dropdown ID and the party ID
     dropdown_id = settings["party_dropdown"]
@@ -253,56 +274,45 @@ def _check_download_and_rename(
     If the file was downloaded successfully, it will be renamed to the base name.
 
     """
+    folder = pathlib.Path(SAVE_FILES_TO) / folder_name
+    new_file = folder / f"{base_name}.xlsx"
+
     # Check if download successful
-    if os.path.exists(f"{SAVE_FILES_TO}/{folder_name}/{base_name}.xlsx"):
+    if new_file.exists():
         return True
 
     try:
         # Look for files that match the first part of the base name
-        matching = [
-            f
-            for f in os.listdir(rf"{SAVE_FILES_TO}/{folder_name}")
-            if fnmatch.fnmatch(f, f"{base_name.split('_')[1]}*.xlsx")
-        ]
+        pattern = f"{base_name.split('_')[1]}*.xlsx"
     except IndexError:
         # If the above fails, check for the full base name
-        matching = [
-            f
-            for f in os.listdir(rf"{SAVE_FILES_TO}/{folder_name}")
-            if fnmatch.fnmatch(f, f"{base_name}*.xlsx")
-        ]
+        pattern = f"{base_name}*.xlsx"
+
+    matching = list(folder.glob(pattern))
 
     # If there are no matching files, return False
     if len(matching) < 1:
         return False
 
     # There should only be one matching file, and we will rename it
-    old_name = matching[0]
-    new_name = f"{base_name}.xlsx"
+    old_file = matching[0]
 
     # If a party is provided, check that the file name contains the party name
     # If it does not, return False
     if party is not None:
-        if party not in list(
-            pd.read_excel(f"{SAVE_FILES_TO}/{folder_name}/{old_name}").Party.unique()
-        ):
+        if party not in list(pd.read_excel(old_file).Party.unique()):
             return False
 
-    try:
-        os.rename(
-            f"{SAVE_FILES_TO}/{folder_name}/{old_name}",
-            f"{SAVE_FILES_TO}/{folder_name}/{new_name}",
-        )
-        logger.debug(f"Successfully downloaded {new_name}")
-    except FileExistsError:
-        print(f"File {new_name} already exists")
-        pass
+    # Path.replace renames in a single call, overwriting any existing file
+    old_file.replace(new_file)
+    logger.debug(f"Successfully downloaded {new_file.name}")
 
     return True
 
 
-def _click_download(driver: webdriver.chrome, button_id: str, wait: int) -> None:
+def _click_download(driver: "webdriver.chrome", button_id: str, wait: int) -> None:
     """Click the export button and wait for the download to finish."""
+    By, EC, WebDriverWait = _selenium_wait_tools()
 
     # Find export button and click
     export = WebDriverWait(driver, 10).until(
@@ -315,7 +325,7 @@ def _click_download(driver: webdriver.chrome, button_id: str, wait: int) -> None
 
 
 def _get_file(
-    driver: webdriver.chrome,
+    driver: "webdriver.chrome",
     button_id: str,
     base_name: str,
     wait: int,
@@ -340,6 +350,8 @@ def _get_file(
 
 
 def _select_brs(driver, settings: dict, br: int | list) -> None:
+    By, EC, WebDriverWait = _selenium_wait_tools()
+
     # Find dropdown element by its ID
     dropdown = WebDriverWait(driver, 10).until(
         EC.presence_of_element_located((By.ID, settings["br_dropdown"]))
@@ -357,6 +369,8 @@ def _select_brs(driver, settings: dict, br: int | list) -> None:
 
 
 def _click_search(driver, settings: dict) -> None:
+    By, EC, WebDriverWait = _selenium_wait_tools()
+
     # Click the search button
     search = WebDriverWait(driver, 10).until(
         EC.presence_of_element_located((By.ID, settings["search_button"]))
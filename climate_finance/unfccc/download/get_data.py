@@ -41,14 +41,14 @@ def _concat_files(directory: pathlib.Path, filename: str) -> pd.DataFrame:
     # Get list of files matching the filename pattern
     files = [file for file in glob.glob(f"{directory}/*") if filename in file]
 
-    # Initialize an empty DataFrame
-    df = pd.DataFrame()
+    # If there are no files, return an empty DataFrame
+    if not files:
+        return pd.DataFrame()
 
-    # Iterate through the list of files and concatenate them into a single DataFrame
-    for file in files:
-        df = pd.concat([df, pd.read_excel(directory / file)])
-
-    return df
+    # Read all the files and concatenate them into a single DataFrame in one step
+    return pd.concat(
+        [pd.read_excel(directory / file) for file in files], ignore_index=True
+    )
 
 
 def _check_and_download(
@@ -160,7 +160,7 @@ def get_unfccc_summary(
 
     # Check that the right parties were included (if specific parties requested)
     if party is not None:
-        df = df.query(f"party in {party}")
+        df = df.loc[df["party"].isin(party)]
     else:
         _check_parties(df, list(PARTY_ID))
 
@@ -229,7 +229,7 @@ def get_unfccc_multilateral(
 
     # Check that the right parties were included (if specific parties requested)
     if party is not None:
-        df = df.query(f"party in {party}")
+        df = df.loc[df["party"].isin(party)]
     else:
         _check_parties(df, list(PARTY_ID))
 
@@ -297,7 +297,7 @@ def get_unfccc_bilateral(
 
     # Check that the right parties were included (if specific parties requested)
     if party is not None:
-        df = df.query(f"party in {party}")
+        df = df.loc[df["party"].isin(party)]
     else:
         _check_parties(df, list(PARTY_ID))
 
@@ -1,5 +1,6 @@
+import re
+
 import pandas as pd
-from bblocks import clean_numeric_series
 from oda_data import set_data_path
 from oda_data.clean_data.channels import (
     add_channel_names,
@@ -20,6 +21,20 @@ from climate_finance.unfccc.cleaning_tools.tools import (
 
 set_data_path(ClimateDataPath.raw_data)
 
+# Characters which are stripped from values before converting them to numbers
+NON_NUMERIC_PATTERN: re.Pattern = re.compile(r"[^\d.]")
+
+# Free-text columns which are cleaned with string methods
+TEXT_COLUMNS: list = ["status", "funding_source", "financial_instrument"]
+
+
+def _text_columns_to_arrow(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert the free-text columns present in the data to pyarrow strings, so that
+    the string methods used to clean them run on arrow buffers."""
+    return df.astype(
+        {column: "string[pyarrow]" for column in TEXT_COLUMNS if column in df.columns}
+    )
+
 
 def clean_unfccc(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -35,9 +50,13 @@ def clean_unfccc(df: pd.DataFrame) -> pd.DataFrame:
     # Pipeline
     df = (
         df.pipe(rename_columns)
+        .pipe(_text_columns_to_arrow)
         .pipe(clean_currency)
         .assign(
-            value=lambda d: clean_numeric_series(d.value),
+            value=lambda d: pd.to_numeric(
+                d.value.str.replace(NON_NUMERIC_PATTERN, "", regex=True),
+                errors="coerce",
+            ).astype(float),
             year=lambda d: d.year.astype("Int32"),
         )
         .dropna(subset=["value"])
@@ -84,24 +103,21 @@ def map_channel_names_to_oecd_codes(
     # add names to the channel names column
     df = add_provider_agency_names(df)
 
-    # create two sets of data to try to match
-    df = df.assign(
-        party_agency=lambda d: d.apply(
-            lambda r: (
-                r[ClimateSchema.PROVIDER_NAME]
-                if str(r[ClimateSchema.PROVIDER_NAME]).lower().strip()
-                == str(r[ClimateSchema.AGENCY_NAME]).lower().strip()
-                else str(r[ClimateSchema.PROVIDER_NAME])
-                + " "
-                + str(r[ClimateSchema.AGENCY_NAME])
-            ),
-            axis=1,
-        )
+    # create two sets of data to try to match. When the agency name is the same as
+    # the provider name, only the provider name is kept.
+    provider = df[ClimateSchema.PROVIDER_NAME]
+    provider_str = provider.astype(str)
+    agency_str = df[ClimateSchema.AGENCY_NAME].astype(str)
+
+    same_name = (
+        provider_str.str.lower().str.strip() == agency_str.str.lower().str.strip()
     )
+    df["party_agency"] = (provider_str + " " + agency_str).where(~same_name, provider)
 
-    # Create a dictionary with channel names as keys and OECD DAC codes as values
+    # Create a dictionary with channel names as keys and OECD DAC codes as values.
+    # Only the unique names are passed, so they are cleaned and matched only once.
     mapping_party_agency = generate_channel_mapping_dictionary(
-        raw_data=df,
+        raw_data=df.drop_duplicates(subset=["party_agency"]),
         channel_names_column="party_agency",
         export_missing_path=export_missing_path,
     )
@@ -14,10 +14,13 @@ from climate_finance.unfccc.manual.read_files import load_br_files_tables7
 
 
 def _table7x_pipeline(
-    folder_path: str | pathlib.Path, table_name: str, clean_func: callable
+    folder_path: str | pathlib.Path,
+    table_name: str,
+    clean_func: callable,
+    max_workers: int | None = 1,
 ):
     """Create a single dataframe of table7 data"""
-    br_data = load_br_files_tables7(folder_path=folder_path)
+    br_data = load_br_files_tables7(folder_path=folder_path, max_workers=max_workers)
 
     data = []
     for country, table in br_data.items():
@@ -33,19 +36,25 @@ def _table7x_pipeline(
     return pd.concat(data, ignore_index=True)
 
 
-def table7_pipeline(folder_path: str | pathlib.Path):
+def table7_pipeline(folder_path: str | pathlib.Path, max_workers: int | None = 1):
     """Create a single dataframe of table7 data"""
-    return _table7x_pipeline(folder_path, "Table 7", clean_table7)
+    return _table7x_pipeline(
+        folder_path, "Table 7", clean_table7, max_workers=max_workers
+    )
 
 
-def table7a_pipeline(folder_path: str | pathlib.Path):
+def table7a_pipeline(folder_path: str | pathlib.Path, max_workers: int | None = 1):
     """Create a single dataframe of table7a data"""
-    return _table7x_pipeline(folder_path, "Table 7(a)", clean_table7a)
+    return _table7x_pipeline(
+        folder_path, "Table 7(a)", clean_table7a, max_workers=max_workers
+    )
 
 
-def table7b_pipeline(folder_path: str | pathlib.Path):
+def table7b_pipeline(folder_path: str | pathlib.Path, max_workers: int | None = 1):
     """Create a single dataframe of table7b data"""
-    return _table7x_pipeline(folder_path, "Table 7(b)", clean_table7b)
+    return _table7x_pipeline(
+        folder_path, "Table 7(b)", clean_table7b, max_workers=max_workers
+    )
 
 
 def get_unfccc_bilateral(
@@ -54,6 +63,7 @@ def get_unfccc_bilateral(
     br: list[int] = None,
     party: str | list[str] = None,
     directory: pathlib.Path | str = ClimateDataPath.raw_data / "br_files",
+    max_workers: int | None = 1,
 ) -> pd.DataFrame:
     """
     Function to get the UNFCCC bilateral data.
@@ -64,6 +74,9 @@ def get_unfccc_bilateral(
         are included.
         party: the party(ies) to include. If None, all parties are included.
         directory: the directory where the BR files are located
+        max_workers: the maximum number of processes used to read the BR files. By
+        default (1) they are read in the current process. If None, as many as there
+        are CPUs are used.
 
     Returns:
 
@@ -85,9 +98,9 @@ def get_unfccc_bilateral(
     for br_version in potential_folders:
         br_number = re.search(r"\d+\.?\d*", br_version).group()
         dfs.append(
-            table7b_pipeline(folder_path=directory / br_version).assign(
-                br=f"BR_{br_number}"
-            )
+            table7b_pipeline(
+                folder_path=directory / br_version, max_workers=max_workers
+            ).assign(br=f"BR_{br_number}")
         )
 
     return pd.concat(dfs, ignore_index=True).filter(BILATERAL_COLUMNS)
@@ -1,6 +1,6 @@
 import json
 import re
-from functools import partial
+from functools import lru_cache, partial
 
 import pandas as pd
 from bblocks import clean_numeric_series
@@ -27,6 +27,25 @@ TABLE7_COLUMNS: list[str] = [
     "additional_information",
 ]
 
+# Regular expressions used to clean strings, compiled once
+DIGITS_PATTERN: re.Pattern = re.compile(r"\d+")
+CHANNEL_NOISE_PATTERN: re.Pattern = re.compile(r"[\d()+-]+|\.+")
+CHANNEL_PREFIX_PATTERN: re.Pattern = re.compile(r"^(?:[a-z]+\s)?([A-Z].*)")
+
+# Replacements applied, in order, to clean up column names
+COLUMN_STRING_REPLACEMENTS: dict[str, str] = {
+    "lc": "l",
+    "cd": "c",
+    "inge": "ing",
+    "rf": "r",
+    "/ general,": "",
+    "Climate-specific, _": "",
+    "fundsh": "funds",
+    "fundg": "fund",
+    "fundsg": "funds",
+    "channels:": "channels",
+}
+
 
 def clean_column_string(string: str):
     """Make a series of replacements to clean up the strings of column names
@@ -38,21 +57,9 @@ def clean_column_string(string: str):
         str: The cleaned string
     """
 
-    string = re.sub(r"\d+", "", str(string))
-
-    replacements = {
-        "lc": "l",
-        "cd": "c",
-        "inge": "ing",
-        "rf": "r",
-        "/ general,": "",
-        "Climate-specific, _": "",
-        "fundsh": "funds",
-        "fundg": "fund",
-        "fundsg": "funds",
-        "channels:": "channels",
-    }
-    for old, new in replacements.items():
+    string = DIGITS_PATTERN.sub("", str(string))
+
+    for old, new in COLUMN_STRING_REPLACEMENTS.items():
         string = string.replace(old, new)
 
     return string.strip("_")
@@ -69,7 +76,10 @@ def find_heading_row(df: pd.DataFrame, heading: str) -> int:
         int: The row number of the heading.
     """
     col = df.columns[0]
-    return df.loc[df[col].str.lower().fillna("").str.contains(heading)].index[0]
+    mask = df[col].str.lower().fillna("").str.contains(heading).to_numpy(dtype=bool)
+
+    # Index the labels directly, rather than filtering a copy of the whole table
+    return df.index[mask][0]
 
 
 def find_last_row(df: pd.DataFrame, row_string: str) -> int:
@@ -83,7 +93,9 @@ def find_last_row(df: pd.DataFrame, row_string: str) -> int:
         int: The row number of the last row of the data.
     """
     col = df.columns[0]
-    return df.loc[df[col].str.lower().fillna("").str.contains(row_string)].index[-1] + 1
+    mask = df[col].str.lower().fillna("").str.contains(row_string).to_numpy(dtype=bool)
+
+    return df.index[mask][-1] + 1
 
 
 def clean_table_7_columns(
@@ -184,6 +196,21 @@ def rename_table_7b_columns(
     return df.rename(columns=columns)
 
 
+def _split_currency_indicator(df: pd.DataFrame) -> pd.DataFrame:
+    """Split the melted 'column' labels into currency and indicator columns.
+
+    Every label repeats once per row of the original table, so only the unique
+    labels are split and the result is aligned back to the rows.
+    """
+    labels = df["column"].unique()
+    parts = pd.Series(labels, index=labels).str.split("_", expand=True)
+
+    df[["currency", "indicator"]] = parts.reindex(df["column"]).to_numpy()
+
+    # Drop the column column
+    return df.drop(columns=["column"]).reset_index(drop=True)
+
+
 def reshape_table_7(df: pd.DataFrame) -> pd.DataFrame:
     """
     Reshape the table 7 dataframes into a long format.
@@ -198,10 +225,7 @@ def reshape_table_7(df: pd.DataFrame) -> pd.DataFrame:
     df_ = df.melt(id_vars=["channel"], var_name="column", value_name="value")
 
     # Split the 'column' into currency and indicator
-    df_[["currency", "indicator"]] = df_.column.str.split("_", expand=True)
-
-    # Drop the column column
-    return df_.drop(columns=["column"]).reset_index(drop=True)
+    return _split_currency_indicator(df_)
 
 
 def reshape_table_7x(df: pd.DataFrame, excluded_cols: list[str]) -> pd.DataFrame:
@@ -223,8 +247,7 @@ def reshape_table_7x(df: pd.DataFrame, excluded_cols: list[str]) -> pd.DataFrame
     )
 
     # Split the 'column' into currency and indicator
-    df_[["currency", "indicator"]] = df_.column.str.split("_", expand=True)
-    return df_.drop(columns=["column"]).reset_index(drop=True)
+    return _split_currency_indicator(df_)
 
 
 # Partial function for table 7a
@@ -236,6 +259,17 @@ reshape_table_7a = partial(
 reshape_table_7b = partial(reshape_table_7x, excluded_cols=["channel"])
 
 
+@lru_cache(maxsize=1)
+def _read_channel_mapping() -> dict[str, str]:
+    """Read the channel type mapping. It is the same for every table, so the json
+    file is only read once per session."""
+    with open(
+        config.ClimateDataPath.unfccc_cleaning_tools / "unfccc_channel_mapping.json",
+        "r",
+    ) as f:
+        return json.load(f)
+
+
 def table7a_heading_mapping(df: pd.DataFrame) -> pd.DataFrame:
     """
     Map rows to the right category based on channels.
@@ -247,20 +281,18 @@ def table7a_heading_mapping(df: pd.DataFrame) -> pd.DataFrame:
         pd.DataFrame: DataFrame with mapped channel types.
     """
 
-    df["channel"] = df.channel.str.replace(f"[\d()+-]+|\.+", "", regex=True).str.strip()
+    df["channel"] = df.channel.str.replace(
+        CHANNEL_NOISE_PATTERN, "", regex=True
+    ).str.strip()
 
     # read mapping from json
-    with open(
-        config.ClimateDataPath.unfccc_cleaning_tools / "unfccc_channel_mapping.json",
-        "r",
-    ) as f:
-        mapping = json.load(f)
+    mapping = _read_channel_mapping()
 
     df["channel_type"] = df.channel.map(mapping)
 
     # fix channel names
     df["channel"] = df.channel.str.replace(
-        r"^(?:[a-z]+\s)?([A-Z].*)", r"\1", regex=True
+        CHANNEL_PREFIX_PATTERN, r"\1", regex=True
     ).str.strip()
 
     return df
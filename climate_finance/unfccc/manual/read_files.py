@@ -1,38 +1,111 @@
 """This script deals with reading in the raw data from the UNFCCC biennial reports."""
 
-import glob
 import pathlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 
 import pandas as pd
 
 
-def _load_br_files(
-    folder_path: str | pathlib.Path, table_pattern: str
-) -> dict[str, pd.DataFrame]:
-    br_files: dict[str, pd.DataFrame] | dict = {}
+def _parse_workbook(
+    party: pathlib.Path, table_pattern: str
+) -> tuple[str, dict[str, pd.DataFrame]]:
+    """Parse the sheets of a single workbook which match the table pattern.
+
+    This is a module-level function so that it can be sent to worker processes.
 
-    # Get all Excel files in the folder path
-    files = [file for file in glob.glob(f"{folder_path}/*.xlsx")]
+    Args:
+        party: The path to the Excel file of a party.
+        table_pattern: The pattern which sheet names must contain to be parsed.
 
-    for party in files:
-        name = str(party).split("/")[-1].split(".")[0]
-        br_files[name] = {}
-        try:
-            file = pd.ExcelFile(party)
-        except FileNotFoundError:
-            continue
+    Returns:
+        A tuple with the name of the party and a dictionary of parsed sheets.
+    """
+    name = party.stem
+    sheets = {}
+
+    try:
+        file = pd.ExcelFile(party)
+    except FileNotFoundError:
+        return name, sheets
 
+    # Open the workbook once, parse all the required sheets and close it
+    with file:
         required = [c for c in file.sheet_names if table_pattern in c]
         for sheet in required:
-            br_files[name][sheet] = file.parse(sheet)
+            sheets[sheet] = file.parse(sheet)
+
+    return name, sheets
+
+
+@lru_cache(maxsize=4)
+def _parsed_workbooks(
+    files: tuple[tuple[pathlib.Path, float], ...], table_pattern: str
+) -> dict[str, dict[str, pd.DataFrame]]:
+    """Return the store for a set of parsed workbooks. The files are passed with
+    their modification time, so a changed workbook gets a new, empty store. The
+    store is filled by _parse_workbooks the first time it is used."""
+    return {}
+
+
+def _parse_workbooks(
+    files: tuple[tuple[pathlib.Path, float], ...],
+    table_pattern: str,
+    max_workers: int | None = 1,
+) -> dict[str, dict[str, pd.DataFrame]]:
+    """Parse a set of workbooks, unless they have already been parsed."""
+    parsed = _parsed_workbooks(files, table_pattern)
+
+    if parsed or not files:
+        return parsed
 
-    return br_files
+    paths = [path for path, _ in files]
 
+    if max_workers == 1 or len(paths) <= 1:
+        # No worker processes are started when they can't help
+        parsed.update(_parse_workbook(path, table_pattern) for path in paths)
+    else:
+        # Each workbook is parsed independently, so they are spread across processes
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            parsed.update(executor.map(_parse_workbook, paths, repeat(table_pattern)))
 
-def load_br_files_tables7(folder_path: str | pathlib.Path) -> dict[str, pd.DataFrame]:
+    return parsed
+
+
+def _load_br_files(
+    folder_path: str | pathlib.Path,
+    table_pattern: str,
+    max_workers: int | None = 1,
+) -> dict[str, pd.DataFrame]:
+    # Get all Excel files in the folder path, with their modification time
+    files = tuple(
+        (file, file.stat().st_mtime)
+        for file in pathlib.Path(folder_path).glob("*.xlsx")
+    )
+
+    br_files = _parse_workbooks(files, table_pattern, max_workers=max_workers)
+
+    # Return copies so that callers can't modify the cached data
+    return {
+        party: {sheet: df.copy() for sheet, df in sheets.items()}
+        for party, sheets in br_files.items()
+    }
+
+
+def load_br_files_tables7(
+    folder_path: str | pathlib.Path, max_workers: int | None = 1
+) -> dict[str, pd.DataFrame]:
     """
     Loads all "Tables 7" from the biennial reports for a given biennial report.
     This function wll look for all Excel files in the folder path and load them into
     a dictionary of DataFrames.
+
+    Args:
+        folder_path: The folder containing the Excel files.
+        max_workers: Optional. The maximum number of processes used to parse the
+        files. Defaults to 1, which parses the files in the current process. None
+        uses as many processes as there are CPUs. Scripts which use more than one
+        process must be protected by an `if __name__ == "__main__":` guard.
     """
-    return _load_br_files(folder_path, table_pattern="Table 7")
+    return _load_br_files(folder_path, table_pattern="Table 7", max_workers=max_workers)
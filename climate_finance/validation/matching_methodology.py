@@ -1,12 +1,86 @@
 from pathlib import Path
 
 import pandas as pd
+from pandas.api.types import union_categoricals
 
 from climate_finance import ClimateData, set_climate_finance_data_path, config
+from climate_finance.core.loaders import cache_loaded_sources
 
 set_climate_finance_data_path(config.ClimateDataPath.raw_data)
 
 
+def _indicators_to_columns(data: pd.DataFrame, index: list[str]) -> pd.DataFrame:
+    """Sum the value of each indicator and spread the indicators as columns.
+
+    Only the index, indicator and value columns are kept before aggregating. Text
+    columns are grouped as categories, as they have few distinct values. The output
+    keeps the original column types, and its rows are sorted by the index.
+
+    Args:
+        data: The climate data, with 'indicator' and 'value' columns.
+        index: The columns which identify each row of the output.
+
+    Returns:
+        A DataFrame with one column per indicator.
+    """
+    data = data.filter(index + ["indicator", "value"], axis=1)
+    dtypes = data.dtypes
+
+    # Group the text columns as categories
+    categories = {
+        column: "category"
+        for column in index + ["indicator"]
+        if pd.api.types.is_string_dtype(data[column])
+    }
+
+    data = (
+        data.astype(categories)
+        .groupby(index + ["indicator"], dropna=False, observed=True)["value"]
+        .sum()
+        .unstack("indicator")
+    )
+
+    # Restore the original types of the indicator names and the index columns
+    data.columns = data.columns.astype(dtypes["indicator"])
+
+    # Rows are sorted as a pivot would, with missing values first
+    return (
+        data.reset_index()
+        .astype({column: dtypes[column] for column in index})
+        .sort_values(index, na_position="first", ignore_index=True)
+    )
+
+
+def _concat_comparisons(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate the aggregated comparison frames.
+
+    The frames are aligned to the same columns and their categorical columns are
+    given the same categories, so that they are not upcast to object.
+
+    Args:
+        frames: The aggregated frames to concatenate.
+
+    Returns:
+        A single DataFrame with the rows of all the frames.
+    """
+    columns = frames[0].columns
+    for frame in frames[1:]:
+        columns = columns.union(frame.columns, sort=False)
+
+    frames = [frame.reindex(columns=columns) for frame in frames]
+
+    for column in columns:
+        if not all(isinstance(f[column].dtype, pd.CategoricalDtype) for f in frames):
+            continue
+        categories = union_categoricals([f[column] for f in frames]).categories
+        frames = [
+            f.assign(**{column: f[column].cat.set_categories(categories)})
+            for f in frames
+        ]
+
+    return pd.concat(frames, ignore_index=True, sort=False)
+
+
 def compare_crdf_crs_disbursements(
     start_year,
     end_year,
@@ -35,31 +109,21 @@ def compare_crdf_crs_disbursements(
             source="OECD_CRDF_CRS",
         )
         .get_data()
-        .groupby(grouper + ["matched", "indicator"], dropna=False, observed=True)[
-            ["value"]
-        ]
-        .sum()
-        .reset_index()
-        .pivot(index=grouper + ["matched"], columns="indicator", values="value")
-        .reset_index()
+        .pipe(_indicators_to_columns, index=grouper + ["matched"])
     )
 
-    crs_df = (
-        crs.load_spending_data(
-            methodology="OECD",
-            flows=[flow],
-            source="OECD_CRS_ALLOCABLE",
-        )
-        .get_data()
-        .loc[lambda d: d.indicator != "not_climate_relevant"]
-        .groupby(grouper + ["indicator"], dropna=False, observed=True)[["value"]]
-        .sum()
-        .reset_index()
-        .pivot(index=grouper, columns="indicator", values="value")
-        .reset_index()
+    crs_data = crs.load_spending_data(
+        methodology="OECD",
+        flows=[flow],
+        source="OECD_CRS_ALLOCABLE",
+    ).get_data()
+
+    # Drop not climate relevant rows before aggregating
+    crs_df = crs_data[crs_data["indicator"] != "not_climate_relevant"].pipe(
+        _indicators_to_columns, index=grouper
     )
 
-    data = pd.concat([crdf_crs_df, crs_df], ignore_index=True)
+    data = _concat_comparisons([crdf_crs_df, crs_df])
 
     return data
 
@@ -85,37 +149,29 @@ def compare_crdf_crdf_crs(
     crdf_crs = ClimateData(years=years, providers=providers)
     crdf = ClimateData(years=years, providers=providers)
 
-    crdf_crs_df = (
-        crdf_crs.load_spending_data(
-            methodology="OECD",
-            flows=[flow],
-            source="OECD_CRDF_CRS",
+    # Both sources use the CRDF, so it is only read from disk once
+    with cache_loaded_sources():
+        crdf_crs_df = (
+            crdf_crs.load_spending_data(
+                methodology="OECD",
+                flows=[flow],
+                source="OECD_CRDF_CRS",
+            )
+            .get_data()
+            .pipe(_indicators_to_columns, index=grouper + ["matched"])
         )
-        .get_data()
-        .groupby(grouper + ["matched", "indicator"], dropna=False, observed=True)[
-            ["value"]
-        ]
-        .sum()
-        .reset_index()
-        .pivot(index=grouper + ["matched"], columns="indicator", values="value")
-        .reset_index()
-    )
 
-    crdf_crdf_df = (
-        crdf.load_spending_data(
-            methodology="OECD",
-            flows=[flow],
-            source="OECD_CRDF",
+        crdf_crdf_df = (
+            crdf.load_spending_data(
+                methodology="OECD",
+                flows=[flow],
+                source="OECD_CRDF",
+            )
+            .get_data()
+            .pipe(_indicators_to_columns, index=grouper)
         )
-        .get_data()
-        .groupby(grouper + ["indicator"], dropna=False, observed=True)[["value"]]
-        .sum()
-        .reset_index()
-        .pivot(index=grouper, columns="indicator", values="value")
-        .reset_index()
-    )
 
-    data = pd.concat([crdf_crs_df, crdf_crdf_df], ignore_index=True)
+    data = _concat_comparisons([crdf_crs_df, crdf_crdf_df])
 
     return data
 
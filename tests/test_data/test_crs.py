@@ -0,0 +1,38 @@
+import pandas as pd
+from oda_data import config
+
+from climate_finance.common.schema import ClimateSchema
+from climate_finance.oecd.crs.get_data import get_crs
+
+
+def test_get_crs_allocable(tmp_path, monkeypatch):
+    # Write a small CRS file, with the column names used by oda_data
+    pd.DataFrame(
+        {
+            "year": [2020, 2020, 2020],
+            "donor_code": [1, 1, 2],
+            "recipient_code": [10, 10, 20],
+            "modality": ["A02", "G01", "C01"],
+            "climate_mitigation": [1, 2, 0],
+            "climate_adaptation": [0, 1, 2],
+            "usd_commitment": [1.0, 2.0, 3.0],
+            "usd_disbursement": [1.0, 2.0, 3.0],
+            "usd_received": [0.0, 0.0, 0.0],
+            "usd_grant_equiv": [1.0, 2.0, 3.0],
+        }
+    ).to_parquet(tmp_path / "fullCRS.parquet")
+    monkeypatch.setattr(config.OdaPATHS, "raw_data", tmp_path)
+
+    data = get_crs(
+        start_year=2020,
+        end_year=2020,
+        groupby=[ClimateSchema.PROVIDER_CODE, ClimateSchema.FLOW_MODALITY],
+        allocable=True,
+    )
+
+    # Test that only allocable aid is kept
+    assert set(data[ClimateSchema.FLOW_MODALITY]) == {"A02", "C01"}
+
+    # Test that the values of the allocable rows are kept
+    commitments = data.loc[data[ClimateSchema.FLOW_TYPE] == "usd_commitment"]
+    assert commitments[ClimateSchema.VALUE].sum() == 4_000_000
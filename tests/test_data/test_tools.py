@@ -0,0 +1,47 @@
+import pandas as pd
+
+from climate_finance.common.schema import ClimateSchema
+from climate_finance.core.tools import (
+    fuzzy_match_provider,
+    get_available_providers,
+    merge_spending_and_contributions,
+)
+
+
+def test_fuzzy_match_provider():
+    options = {v: k for k, v in get_available_providers(include_private=True).items()}
+
+    # Test for a name which scores just below 89 but rounds to it ("Japn" vs "Japan")
+    assert fuzzy_match_provider(["Japn"], options) == [701]
+
+    # Test for names which should not be matched
+    assert fuzzy_match_provider(["zzz", ""], options) == []
+
+    # Test for an empty list of providers
+    assert fuzzy_match_provider([], options) == []
+
+
+def test_merge_spending_and_contributions():
+    contributions = pd.DataFrame(
+        {
+            ClimateSchema.PROVIDER_CODE: [4, None, 1, 4],
+            ClimateSchema.CHANNEL_CODE: [2, 1, 1, 1],
+            ClimateSchema.VALUE: [10.0, 20.0, 30.0, 40.0],
+        }
+    )
+    spending = pd.DataFrame(
+        {
+            ClimateSchema.CHANNEL_CODE: [1, 2],
+            ClimateSchema.VALUE: [0.5, 0.25],
+        }
+    )
+
+    merged = merge_spending_and_contributions(spending, contributions)
+
+    # Test that contributions without a provider code are dropped
+    assert merged[ClimateSchema.PROVIDER_CODE].notna().all()
+
+    # Test that the rows of each provider are kept together, in order of appearance
+    assert merged[ClimateSchema.PROVIDER_CODE].tolist() == [4, 4, 1]
+    assert merged[f"{ClimateSchema.VALUE}_inflow"].tolist() == [10.0, 40.0, 30.0]
+    assert merged[f"{ClimateSchema.VALUE}_spending_share"].tolist() == [0.25, 0.5, 0.5]